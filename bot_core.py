@@ -12,13 +12,33 @@ import time
 import smtplib
 import random
 import json
-from urllib.parse import urlparse, parse_qs, urlencode
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from email.mime.image import MIMEImage
-from typing import Any, NoReturn, Optional
-
-from config import MS_PER_SECOND, SECONDS_PER_MINUTE
+import socket
+import re
+import atexit
+import base64
+import functools
+import mimetypes
+import queue
+import signal
+import threading
+from email.header import Header
+from collections import OrderedDict
+from typing import Any, Dict, NoReturn, Optional, Tuple
+
+from config import DEFAULT_TIMEOUT, MS_PER_SECOND, SCREENSHOT_QUALITY, SECONDS_PER_MINUTE
+
+# Playwright's base error (TimeoutError subclasses it). Falls back to Exception
+# so bot_core stays importable without Playwright (e.g. proxy_helper CLI).
+try:
+    from playwright.sync_api import Error as PlaywrightError
+except ImportError:
+    PlaywrightError = Exception
+
+# Optional: inotify lets a pause block until pause.lock is removed (Linux only).
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+except ImportError:
+    INotify = None
 
 # ================= Constants =================
 # NOTE: These values preserve the template's original behavior. Adjusting them
@@ -34,16 +54,35 @@ DEFAULT_MAX_WAIT_MINUTES = 45
 # How many URL characters to show before masking the rest (avoid leaking tokens).
 MASK_URL_VISIBLE_PREFIX_CHARS = 25
 
+# Distinct URLs whose masked form is memoized.
+MASK_URL_CACHE_MAX_ENTRIES = 64
+
+# SMTP DATA helpers: normalize line endings to CRLF and dot-stuff leading periods.
+_SMTP_BARE_EOL_RE = re.compile(r'(?:\r\n|\n|\r(?!\n))')
+_SMTP_LEADING_PERIOD_RE = re.compile(br'(?m)^\.')
+
+# Matches each "=value" segment of a query string (value runs up to the next '&').
+_QS_VALUE_RE = re.compile(r'=[^&]*')
+
 # Remote control commands older than this (seconds) are ignored.
 REMOTE_COMMAND_EXPIRY_SECONDS = 60
 
 # How often to poll (seconds) while a pause lock file exists.
 PAUSE_LOCK_POLL_INTERVAL_SECONDS = 5
 
+# Safety-net re-check interval (seconds) while blocked on inotify during a pause.
+PAUSE_LOCK_INOTIFY_RECHECK_SECONDS = 30
+
+# How often (seconds) an interruptible sleep looks for a new command/pause file.
+REMOTE_CONTROL_WAKE_CHECK_SECONDS = 5
+
 # Default human-like delay range (seconds) between actions.
 HUMAN_DELAY_MIN_SECONDS_DEFAULT = 0.5
 HUMAN_DELAY_MAX_SECONDS_DEFAULT = 2.0
 
+# Number of uniform [0, 1) samples generated per refill of the delay noise table.
+HUMAN_DELAY_NOISE_TABLE_SIZE = 4096
+
 # Default max wait time (seconds) for safe click operations.
 SAFE_CLICK_MAX_WAIT_SECONDS_DEFAULT = 5
 
@@ -53,9 +92,18 @@ FIND_BUTTON_VISIBLE_TIMEOUT_MS = 300
 # Element stability detection defaults.
 ELEMENT_STABILITY_TIMEOUT_SECONDS_DEFAULT = 2.0
 ELEMENT_STABILITY_THRESHOLD_PX_DEFAULT = 2
-ELEMENT_STABILITY_BOUNDING_BOX_TIMEOUT_MS = 200
+ELEMENT_STABILITY_BOUNDING_BOX_TIMEOUT_MS = 120
 ELEMENT_STABILITY_REQUIRED_STABLE_CHECKS = 2
-ELEMENT_STABILITY_POLL_INTERVAL_SECONDS = 0.1
+# Poll interval backs off from INITIAL by BACKOFF per unstable check, up to MAX.
+ELEMENT_STABILITY_POLL_INTERVAL_INITIAL_SECONDS = 0.05
+ELEMENT_STABILITY_POLL_INTERVAL_MAX_SECONDS = 0.3
+ELEMENT_STABILITY_POLL_BACKOFF_FACTOR = 1.5
+
+# Page pool: pages rotated round-robin, each replaced after this many cycles
+# to bound DOM/JS-heap growth over long runs. One page by default: extra tabs
+# of the same logged-in app go stale between turns and may trip single-tab apps.
+PAGE_POOL_SIZE = 1
+MAX_USES_PER_PAGE = 50
 
 # Recovery system tuning.
 RECOVERY_MAX_A_ERRORS = 5
@@ -69,9 +117,29 @@ RECOVERY_B_POST_GOTO_SLEEP_SECONDS = 3
 RECOVERY_C_RESTART_DELAY_SECONDS = 30
 RECOVERY_RESTART_EXIT_CODE = 2
 
+# Counters cleared when a recovery level succeeds. Level A only clears its own
+# failure count so that "A succeeded but the error came back" keeps escalating.
+RECOVERY_COUNTERS_RESET_ON_SUCCESS = {
+    "A": ("error_count_a",),
+    "B": ("error_count_a", "error_count_b", "a_still_fail_count"),
+}
+
 # Timeout (ms) used when checking for password field visibility in login detection.
 PASSWORD_FIELD_VISIBLE_TIMEOUT_MS = 500
 
+# URL patterns that indicate a login page (case-insensitive substring match).
+_LOGIN_URL_RE = re.compile(r'login|signin|auth|account', re.IGNORECASE)
+
+# In-page equivalent of the URL pattern + visible password field checks.
+_IS_LOGIN_REQUIRED_JS = """() => {
+    if (/%s/i.test(location.href)) return true;
+    for (const el of document.querySelectorAll("input[type='password']")) {
+        const rect = el.getBoundingClientRect();
+        if (rect.width > 0 && rect.height > 0 && getComputedStyle(el).visibility !== 'hidden') return true;
+    }
+    return false;
+}""" % _LOGIN_URL_RE.pattern
+
 # Login waiting defaults.
 WAIT_FOR_LOGIN_DEFAULT_TIMEOUT_MINUTES = 30
 LOGIN_ALERT_BANNER_WIDTH = 50
@@ -81,6 +149,56 @@ LOGIN_POLL_INTERVAL_SECONDS = 5
 SAFE_VISIBLE_TIMEOUT_MS_DEFAULT = 400
 SAFE_WAIT_TIMEOUT_MS_DEFAULT = 5000
 
+# Max number of encoded email image attachments kept for reuse across alerts.
+MIME_IMAGE_CACHE_MAX_ENTRIES = 4
+
+# Raw alert email framing (CRLF line endings; all parts base64-encoded).
+ALERT_MAIL_BOUNDARY = "==bot-alert-boundary=="
+ALERT_MAIL_HEADER_TEMPLATE = "From: {from_}\r\nTo: {to}\r\nSubject: {subject}\r\nMIME-Version: 1.0\r\n"
+ALERT_MAIL_TEXT_PART_HEADERS = (
+    "Content-Type: text/plain; charset=\"utf-8\"\r\n"
+    "Content-Transfer-Encoding: base64\r\n\r\n"
+)
+ALERT_MAIL_IMAGE_PART_HEADERS = (
+    "Content-Type: {content_type}; name=\"attachment{ext}\"\r\n"
+    "Content-Transfer-Encoding: base64\r\n"
+    "Content-Disposition: attachment; filename=\"attachment{ext}\"\r\n\r\n"
+)
+
+# Attachment type sniffed from the file's leading bytes: (magic, content type, extension).
+# Files matching none fall back to the extension, then application/octet-stream.
+ALERT_MAIL_IMAGE_SIGNATURES = (
+    (b"\x89PNG\r\n\x1a\n", "image/png", ".png"),
+    (b"\xff\xd8\xff", "image/jpeg", ".jpg"),
+    (b"GIF8", "image/gif", ".gif"),
+    (b"BM", "image/bmp", ".bmp"),
+)
+
+# Pooled SMTP connection: connect/IO timeout, NOOP probe timeout, and idle time
+# below which the connection is reused without a NOOP probe (seconds).
+SMTP_CONNECT_TIMEOUT_SECONDS = 30
+SMTP_NOOP_TIMEOUT_SECONDS = 5
+SMTP_SKIP_NOOP_IDLE_SECONDS = 100
+
+# Background alert delivery: max pending emails, and how long (seconds) to wait
+# for pending emails before a Level C exit or interpreter shutdown.
+ALERT_QUEUE_MAX_SIZE = 32
+ALERT_FLUSH_TIMEOUT_SECONDS = 10
+
+# Connection-level send failures are retried with exponential backoff (seconds).
+ALERT_SEND_MAX_ATTEMPTS = 3
+ALERT_SEND_RETRY_INITIAL_DELAY_SECONDS = 1
+
+# Log file buffering: buffer size (bytes) and unflushed backlog (chars) that
+# forces a flush regardless of line count.
+LOG_FILE_BUFFER_SIZE = 8192
+LOG_FLUSH_THRESHOLD_CHARS = 4096
+
+# Flush the log file after this many buffered lines, and at least this often
+# (seconds) while output is pending.
+LOG_FLUSH_EVERY_LINES = 16
+LOG_FLUSH_INTERVAL_SECONDS = 2
+
 # ================= Configuration =================
 
 # Target URL - Override in your implementation
@@ -93,11 +211,20 @@ MAIL_USER = os.environ.get('MAIL_USER', "")
 MAIL_PASS = os.environ.get('MAIL_PASS', "")
 MAIL_RECEIVER = os.environ.get('MAIL_RECEIVER', "")
 
+# Shared browser: connect to this CDP endpoint (e.g. http://127.0.0.1:9222)
+# instead of launching a private Chromium per process
+PLAYWRIGHT_CDP = os.environ.get('PLAYWRIGHT_CDP', "")
+
 # Control files
 LOCK_FILE = "pause.lock"
 CMD_FILE = "command.txt"
+CMD_FILE_STAGING_SUFFIX = ".inflight"
 QR_IMAGE = "login_qr.png"
-MONITOR_IMAGE = "monitor.png"
+MONITOR_IMAGE = "monitor.jpg"
+
+# Monitor screenshot paths resolved once at import (written every cycle).
+_MONITOR_ABS_PATH = os.path.abspath(MONITOR_IMAGE)
+_MONITOR_TMP_PATH = _MONITOR_ABS_PATH + ".tmp"
 
 # Subscription management files
 SUBSCRIBE_URL_FILE = "subscribe_url.txt"
@@ -107,42 +234,152 @@ SUBSCRIBE_STATUS_FILE = "subscribe_status.json"
 MIN_WAIT = int(os.environ.get('MIN_WAIT', DEFAULT_MIN_WAIT_MINUTES))
 MAX_WAIT = int(os.environ.get('MAX_WAIT', DEFAULT_MAX_WAIT_MINUTES))
 
+# Derived values precomputed once at import (avoid per-call unit conversion).
+# Bounds are ordered so get_wait_time()'s randrange also accepts MIN_WAIT > MAX_WAIT
+# (as random.uniform did) instead of failing every cycle.
+_MIN_WAIT_SEC, _MAX_WAIT_SEC = sorted((MIN_WAIT * SECONDS_PER_MINUTE, MAX_WAIT * SECONDS_PER_MINUTE))
+
 # ================= Logging =================
 
 class DualLogger:
-    """Dual output logger - writes to both terminal and file"""
+    """
+    Dual output logger - writes to both terminal and file.
+
+    File output is buffered and flushed in batches: every few lines, when the
+    unflushed backlog grows large, or by a background flusher within a couple
+    of seconds so `tail -f` never lags far behind.
+    """
     def __init__(self, filepath):
         self.terminal = sys.stdout
-        self.log = open(filepath, "a", encoding="utf-8")
+        self.log = open(filepath, "a", encoding="utf-8", buffering=LOG_FILE_BUFFER_SIZE)
+        self._lock = threading.Lock()
+        self._unflushed = 0
+        self._pending_lines = 0
+        threading.Thread(target=self._flush_periodically, name="log-flush", daemon=True).start()
+        atexit.register(self.flush)
 
     def write(self, message: str) -> None:
         self.terminal.write(message)
-        self.log.write(message)
-        self.log.flush()
+        with self._lock:
+            self.log.write(message)
+            self._unflushed += len(message)
+            self._pending_lines += message.count('\n')
+            if (
+                self._pending_lines >= LOG_FLUSH_EVERY_LINES
+                or self._unflushed >= LOG_FLUSH_THRESHOLD_CHARS
+            ):
+                self._flush_log()
+
+    def _flush_log(self) -> None:
+        # Caller holds self._lock
+        if not self.log.closed:
+            self.log.flush()
+        self._unflushed = 0
+        self._pending_lines = 0
+
+    def _flush_periodically(self) -> None:
+        while True:
+            time.sleep(LOG_FLUSH_INTERVAL_SECONDS)
+            with self._lock:
+                if self._unflushed:
+                    self._flush_log()
 
     def flush(self) -> None:
         self.terminal.flush()
-        self.log.flush()
+        with self._lock:
+            self._flush_log()
 
 # ================= Core Utilities =================
 
-def atomic_write(filepath: str, content: str) -> None:
-    """Atomic file write - write to .tmp then rename, avoid partial reads"""
+def atomic_write(filepath: str, content: str, durable: bool = True) -> None:
+    """
+    Atomic file write - write to .tmp then rename, avoid partial reads.
+    Durable writes are synced to disk before the rename.
+
+    Pass durable=False for non-critical, frequently rewritten state files to
+    write the target in place and skip the tmp+rename round-trip.
+    """
+    if not durable:
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return
     tmp_path = filepath + '.tmp'
+    if _write_via_tmpfile(tmp_path, content.encode('utf-8')):
+        os.replace(tmp_path, filepath)
+        return
     with open(tmp_path, 'w', encoding='utf-8') as f:
         f.write(content)
+        f.flush()
+        os.fsync(f.fileno())
     os.replace(tmp_path, filepath)
 
+# Cleared after the first O_TMPFILE open/link failure, so later durable writes
+# go straight to the fallback instead of writing and syncing the data twice.
+_tmpfile_supported = getattr(os, 'O_TMPFILE', None) is not None
+
+def _write_via_tmpfile(tmp_path: str, data: bytes) -> bool:
+    """
+    Linux: write data to an anonymous O_TMPFILE inode, sync it, then link it
+    in as tmp_path. A crash mid-write leaves no half-written .tmp file behind.
+    Returns False when O_TMPFILE or linking it is unsupported (other OS,
+    filesystem or sandbox) so the caller can fall back.
+    """
+    global _tmpfile_supported
+    if not _tmpfile_supported:
+        return False
+    try:
+        fd = os.open(os.path.dirname(os.path.abspath(tmp_path)), os.O_TMPFILE | os.O_WRONLY, 0o666)
+    except OSError:
+        _tmpfile_supported = False
+        return False
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        os.fdatasync(fd)
+        try:
+            os.unlink(tmp_path)  # stale leftover from an interrupted replace
+        except FileNotFoundError:
+            pass
+        try:
+            os.link(f'/proc/self/fd/{fd}', tmp_path)
+        except OSError:
+            # e.g. /proc unavailable or EXDEV - the anonymous inode is simply freed
+            _tmpfile_supported = False
+            return False
+    except OSError:
+        return False
+    finally:
+        os.close(fd)
+    return True
+
+_json_file_cache: Dict[str, Tuple[Tuple[int, int, int], Any]] = {}
+
 def safe_read_json(filepath: str, default: Optional[Any] = None) -> Optional[Any]:
-    """Safely read JSON file, return default on any error"""
+    """
+    Safely read JSON file, return default on any error.
+
+    Parsed results are cached per path and reused while the file's inode,
+    mtime and size are unchanged. The returned object is shared with the
+    cache - copy it before mutating.
+    """
     try:
-        if not os.path.exists(filepath):
+        st = os.stat(filepath)
+        key = (st.st_ino, st.st_mtime_ns, st.st_size)
+        cached = _json_file_cache.get(filepath)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        # Binary read: json decodes UTF-8 bytes itself, no intermediate str copy
+        with open(filepath, 'rb') as f:
+            content = f.read()
+        if not content or content.isspace():
             return default
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read().strip()
-            if not content:
-                return default
-            return json.loads(content)
+        data = json.loads(content)
+        _json_file_cache[filepath] = (key, data)
+        return data
+    except FileNotFoundError:
+        _json_file_cache.pop(filepath, None)
+        return default
     except (json.JSONDecodeError, IOError, OSError, UnicodeDecodeError) as e:
         print(f"    [Warning] Failed to read {filepath}: {e}")
         return default
@@ -155,14 +392,26 @@ def mask_url(url: Optional[str]) -> str:
     """
     if not url:
         return "(empty)"
+    if isinstance(url, str):
+        return _mask_url_cached(url)
+    return _mask_url_impl(url)
+
+@functools.lru_cache(maxsize=MASK_URL_CACHE_MAX_ENTRIES)
+def _mask_url_cached(url: str) -> str:
+    # The same subscription URL is masked on every status write/log line
+    return _mask_url_impl(url)
+
+def _mask_url_impl(url: str) -> str:
     try:
-        parsed = urlparse(url)
-        base = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
-        if parsed.query:
-            params = parse_qs(parsed.query, keep_blank_values=True)
-            masked = {k: ['***'] for k in params.keys()}
-            return f"{base}?{urlencode(masked, doseq=True)}"
-        return base
+        # Single pass: drop the fragment, then blank every "=value" in the query
+        base, _, _ = url.partition('#')
+        q = base.find('?')
+        if q < 0:
+            return base
+        query = base[q + 1:]
+        if not query:
+            return base[:q]
+        return base[:q + 1] + _QS_VALUE_RE.sub('=***', query)
     except Exception:
         return (
             url[:MASK_URL_VISIBLE_PREFIX_CHARS] + "...***"
@@ -173,40 +422,292 @@ def mask_url(url: Optional[str]) -> str:
 def update_monitor(page: Any) -> None:
     """Update monitoring screenshot (atomic operation, silent fail)"""
     try:
-        abs_path = os.path.abspath(MONITOR_IMAGE)
-        tmp_path = abs_path + ".tmp"
-        page.screenshot(path=tmp_path, type='png')
+        # JPEG encodes much faster and smaller than PNG for a frame rewritten every cycle
+        data = page.screenshot(type='jpeg', quality=SCREENSHOT_QUALITY)
+        with open(_MONITOR_TMP_PATH, 'wb') as f:
+            f.write(data)
         try:
-            os.replace(tmp_path, abs_path)
+            os.replace(_MONITOR_TMP_PATH, _MONITOR_ABS_PATH)
         except OSError:
             pass
     except Exception:
         pass
 
-def send_alert_email(subject: str, body: str, image_path: Optional[str] = None) -> None:
-    """Send alert email notification"""
-    if not MAIL_USER or not MAIL_PASS:
-        print(f"    [Email] Skipped (not configured): {subject}")
-        return
+class _PipelinedSMTP(smtplib.SMTP_SSL):
+    """
+    SMTP_SSL that batches MAIL FROM / RCPT TO / DATA into one write when the
+    server advertises PIPELINING (RFC 2920), saving a round-trip per command.
+    Falls back to the stock sendmail() otherwise or when ESMTP options are used.
+    """
+
+    def sendmail(self, from_addr, to_addrs, msg, mail_options=(), rcpt_options=()):
+        self.ehlo_or_helo_if_needed()
+        if mail_options or rcpt_options or not self.has_extn("pipelining"):
+            return super().sendmail(from_addr, to_addrs, msg, mail_options, rcpt_options)
+
+        if isinstance(msg, str):
+            msg = _SMTP_BARE_EOL_RE.sub("\r\n", msg).encode("ascii")
+        if isinstance(to_addrs, str):
+            to_addrs = [to_addrs]
+
+        mail_opts = " size=%d" % len(msg) if self.has_extn("size") else ""
+        commands = ["MAIL FROM:%s%s\r\n" % (smtplib.quoteaddr(from_addr), mail_opts)]
+        commands.extend("RCPT TO:%s\r\n" % smtplib.quoteaddr(addr) for addr in to_addrs)
+        commands.append("DATA\r\n")
+        self.send("".join(commands))
+
+        # Replies arrive in command order
+        mail_code, mail_resp = self.getreply()
+        senderrs = {}
+        for addr in to_addrs:
+            code, resp = self.getreply()
+            if code not in (250, 251):
+                senderrs[addr] = (code, resp)
+        data_code, data_resp = self.getreply()
+
+        if mail_code != 250 or len(senderrs) == len(to_addrs) or data_code != 354:
+            if data_code == 354:
+                # Server is waiting for a body we no longer want to deliver
+                self.send(b".\r\n")
+                self.getreply()
+            if 421 in (mail_code, data_code):
+                self.close()
+            else:
+                self._rset()
+            if mail_code != 250:
+                raise smtplib.SMTPSenderRefused(mail_code, mail_resp, from_addr)
+            if len(senderrs) == len(to_addrs):
+                raise smtplib.SMTPRecipientsRefused(senderrs)
+            raise smtplib.SMTPDataError(data_code, data_resp)
+
+        body = _SMTP_LEADING_PERIOD_RE.sub(b"..", msg)
+        if not body.endswith(b"\r\n"):
+            body += b"\r\n"
+        self.send(body + b".\r\n")
+        code, resp = self.getreply()
+        if code != 250:
+            if code == 421:
+                self.close()
+            else:
+                self._rset()
+            raise smtplib.SMTPDataError(code, resp)
+        return senderrs
+
+class _SMTPPool:
+    """
+    Lazily-connected SMTP session shared across alerts.
+
+    Avoids paying the TLS + AUTH handshake on every email. A session used
+    recently is reused as-is; an idle one is health-checked with NOOP first
+    and rebuilt if the server dropped it.
+    """
+
+    def __init__(self):
+        self._server = None
+        self._last_used = 0.0
+        self.lock = threading.Lock()
 
+    def _connect(self) -> smtplib.SMTP_SSL:
+        server = _PipelinedSMTP(MAIL_HOST, MAIL_PORT, timeout=SMTP_CONNECT_TIMEOUT_SECONDS)
+        server.login(MAIL_USER, MAIL_PASS)
+        return server
+
+    def _is_alive(self) -> bool:
+        sock = self._server.sock
+        try:
+            sock.settimeout(SMTP_NOOP_TIMEOUT_SECONDS)
+            return self._server.noop()[0] == 250
+        except Exception:
+            return False
+        finally:
+            try:
+                sock.settimeout(SMTP_CONNECT_TIMEOUT_SECONDS)
+            except Exception:
+                pass
+
+    def get(self) -> smtplib.SMTP_SSL:
+        """Return a live server connection (caller must hold `lock`)"""
+        now = time.monotonic()
+        if self._server is not None:
+            if now - self._last_used < SMTP_SKIP_NOOP_IDLE_SECONDS or self._is_alive():
+                self._last_used = now
+                return self._server
+            self._discard()
+        self._server = self._connect()
+        self._last_used = now
+        return self._server
+
+    def _discard(self) -> None:
+        try:
+            self._server.close()
+        except Exception:
+            pass
+        self._server = None
+
+    def invalidate(self) -> None:
+        """Drop the current connection so the next get() reconnects"""
+        if self._server is not None:
+            self._discard()
+
+    def close(self) -> None:
+        """Gracefully close the shared connection (registered with atexit)"""
+        with self.lock:
+            if self._server is None:
+                return
+            try:
+                self._server.quit()
+            except Exception:
+                pass
+            self._server = None
+
+_smtp_pool = _SMTPPool()
+atexit.register(_smtp_pool.close)
+
+_image_b64_cache: "OrderedDict[Tuple[str, int, int], Tuple[bytes, bytes]]" = OrderedDict()
+
+def _image_part_headers(image_path: str, data: bytes) -> bytes:
+    """MIME headers for the attachment, typed from its magic bytes (like MIMEImage)"""
+    for magic, content_type, ext in ALERT_MAIL_IMAGE_SIGNATURES:
+        if data.startswith(magic):
+            break
+    else:
+        if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+            content_type, ext = "image/webp", ".webp"
+        else:
+            ext = os.path.splitext(image_path)[1].lower()
+            content_type = mimetypes.guess_type(image_path)[0] or "application/octet-stream"
+    return ALERT_MAIL_IMAGE_PART_HEADERS.format(content_type=content_type, ext=ext).encode("ascii")
+
+def _load_image_b64(image_path: str) -> Optional[Tuple[bytes, bytes]]:
+    """
+    Return (part headers, CRLF-wrapped base64) for the image, reusing both
+    while the file is unchanged (keyed by path, mtime and size). None if missing.
+    """
+    try:
+        st = os.stat(image_path)
+    except OSError:
+        return None
+    key = (image_path, st.st_mtime_ns, st.st_size)
+    encoded = _image_b64_cache.get(key)
+    if encoded is not None:
+        _image_b64_cache.move_to_end(key)
+        return encoded
+    with open(image_path, 'rb') as f:
+        data = f.read()
+    encoded = (_image_part_headers(image_path, data), base64.encodebytes(data).replace(b"\n", b"\r\n"))
+    _image_b64_cache[key] = encoded
+    if len(_image_b64_cache) > MIME_IMAGE_CACHE_MAX_ENTRIES:
+        _image_b64_cache.popitem(last=False)
+    return encoded
+
+def _build_alert_message(subject: str, body: str, image: Optional[Tuple[bytes, bytes]]) -> bytes:
+    """
+    Assemble the raw RFC 5322 message directly as bytes instead of building an
+    email.mime tree. Multipart framing is only used when there is an image.
+    Every part is base64, so the fixed boundary (which contains '-') can
+    never occur inside a part.
+    """
+    if subject.isascii():
+        subject = " ".join(subject.splitlines())
+    else:
+        subject = Header(subject, "utf-8").encode(linesep="\r\n")
+    headers = ALERT_MAIL_HEADER_TEMPLATE.format(from_=MAIL_USER, to=MAIL_RECEIVER, subject=subject)
+    text_b64 = base64.encodebytes(body.encode("utf-8")).replace(b"\n", b"\r\n")
+    if image is None:
+        return (headers + ALERT_MAIL_TEXT_PART_HEADERS).encode("utf-8") + text_b64
+    image_headers, image_b64 = image
+    boundary = ALERT_MAIL_BOUNDARY.encode("ascii")
+    return b"".join((
+        (headers + "Content-Type: multipart/mixed; boundary=\"%s\"\r\n\r\n" % ALERT_MAIL_BOUNDARY).encode("utf-8"),
+        b"--", boundary, b"\r\n", ALERT_MAIL_TEXT_PART_HEADERS.encode("ascii"), text_b64,
+        b"--", boundary, b"\r\n", image_headers, image_b64,
+        b"--", boundary, b"--\r\n",
+    ))
+
+def _deliver_alert_email(subject: str, body: str, image: Optional[Tuple[bytes, bytes]] = None) -> None:
+    """Build and send one alert email over the pooled SMTP connection (blocking)"""
     print(f"    [Email] Sending: {subject}...")
     try:
-        msg = MIMEMultipart()
-        msg['From'] = MAIL_USER
-        msg['To'] = MAIL_RECEIVER
-        msg['Subject'] = subject
-        msg.attach(MIMEText(body, 'plain'))
-        if image_path and os.path.exists(image_path):
-            with open(image_path, 'rb') as f:
-                msg.attach(MIMEImage(f.read(), name="attachment.png"))
-        server = smtplib.SMTP_SSL(MAIL_HOST, MAIL_PORT)
-        server.login(MAIL_USER, MAIL_PASS)
-        server.sendmail(MAIL_USER, MAIL_RECEIVER, msg.as_string())
-        server.quit()
+        msg = _build_alert_message(subject, body, image)
+        retry_delay = ALERT_SEND_RETRY_INITIAL_DELAY_SECONDS
+        for attempt in range(1, ALERT_SEND_MAX_ATTEMPTS + 1):
+            try:
+                with _smtp_pool.lock:
+                    _smtp_pool.get().sendmail(MAIL_USER, MAIL_RECEIVER, msg)
+                break
+            except (smtplib.SMTPServerDisconnected, ConnectionError, socket.timeout) as e:
+                # Connection-level failure - drop the session and retry on a fresh one
+                with _smtp_pool.lock:
+                    _smtp_pool.invalidate()
+                if attempt == ALERT_SEND_MAX_ATTEMPTS:
+                    raise
+                print(f"    [Email] Connection lost ({e}), retrying in {retry_delay}s...")
+                time.sleep(retry_delay)
+                retry_delay *= 2
         print("    [Email] Sent successfully!")
     except Exception as e:
         print(f"    [Email Failed] {e}")
 
+_alert_queue: "queue.Queue" = queue.Queue(maxsize=ALERT_QUEUE_MAX_SIZE)
+_alert_worker_lock = threading.Lock()
+_alert_worker: Optional[threading.Thread] = None
+
+def _alert_worker_loop() -> None:
+    """Drain queued alerts; a threading.Event item is a flush barrier"""
+    while True:
+        item = _alert_queue.get()
+        try:
+            if isinstance(item, threading.Event):
+                item.set()
+            else:
+                _deliver_alert_email(*item)
+        finally:
+            _alert_queue.task_done()
+
+def _ensure_alert_worker() -> None:
+    global _alert_worker
+    with _alert_worker_lock:
+        if _alert_worker is None or not _alert_worker.is_alive():
+            _alert_worker = threading.Thread(target=_alert_worker_loop, name="alert-email", daemon=True)
+            _alert_worker.start()
+
+def send_alert_email(subject: str, body: str, image_path: Optional[str] = None) -> None:
+    """
+    Queue an alert email notification (non-blocking).
+    Delivery happens on a background worker; use flush_alerts() to wait for it.
+    """
+    if not MAIL_USER or not MAIL_PASS:
+        print(f"    [Email] Skipped (not configured): {subject}")
+        return
+
+    # Read the image now, on the caller's thread: the file may be rewritten
+    # (e.g. the next QR screenshot) before the worker gets to this alert.
+    image = None
+    if image_path:
+        try:
+            image = _load_image_b64(image_path)
+        except OSError as e:
+            print(f"    [Email] Could not read attachment {image_path}: {e}")
+
+    _ensure_alert_worker()
+    try:
+        _alert_queue.put_nowait((subject, body, image))
+    except queue.Full:
+        print(f"    [Email] Queue full, dropped: {subject}")
+
+def flush_alerts(timeout: float = ALERT_FLUSH_TIMEOUT_SECONDS) -> bool:
+    """Wait until alerts queued so far are delivered. Returns False on timeout."""
+    if _alert_worker is None or not _alert_worker.is_alive():
+        return True
+    barrier = threading.Event()
+    try:
+        _alert_queue.put(barrier, timeout=timeout)
+    except queue.Full:
+        return False
+    return barrier.wait(timeout)
+
+atexit.register(flush_alerts)
+
 def _parse_command(raw_content):
     """
     Parse command content, supports two formats:
@@ -214,39 +715,90 @@ def _parse_command(raw_content):
     2. Plain text: xxx (backward compatible)
     Returns: (cmd_name, timestamp)
     """
+    content = raw_content.strip()
+    # Fast path: only a JSON object can carry a command, skip the parser otherwise
+    if content[:1] != '{':
+        return content, 0
     try:
-        data = json.loads(raw_content)
+        data = json.loads(content)
         if not isinstance(data, dict):
             return None, 0
         cmd = data.get('cmd', '')
         ts = data.get('ts', 0)
         # Ignore commands older than a fixed threshold to avoid replaying stale actions.
-        if ts and time.time() - ts > REMOTE_COMMAND_EXPIRY_SECONDS:
-            print(f"    [Remote] Command expired ({int(time.time() - ts)}s ago), ignoring")
+        # ts is a Unix timestamp from the writer, so this age stays on wall-clock time
+        age = time.time() - ts if ts else 0
+        if age > REMOTE_COMMAND_EXPIRY_SECONDS:
+            print(f"    [Remote] Command expired ({int(age)}s ago), ignoring")
             return None, ts
         return cmd, ts
     except (json.JSONDecodeError, TypeError):
         # Backward compatible: plain text format
-        return raw_content.strip(), 0
+        return content, 0
+
+def _claim_command_file() -> Optional[str]:
+    """
+    Take ownership of CMD_FILE by renaming it to a staging path, then read it.
+    A command written while we are reading lands in a fresh CMD_FILE instead
+    of being deleted unseen. Returns None if there is no pending command.
+    """
+    staged = CMD_FILE + CMD_FILE_STAGING_SUFFIX
+    try:
+        os.replace(CMD_FILE, staged)
+    except FileNotFoundError:
+        return None
+    try:
+        with open(staged, 'r') as f:
+            return f.read().strip()
+    finally:
+        os.remove(staged)
+
+@functools.lru_cache(maxsize=None)
+def _get_proxy_helper() -> Any:
+    """Import proxy_helper on first use (it imports bot_core, so not at module top)"""
+    import proxy_helper
+    return proxy_helper
+
+def _wait_for_lock_release() -> None:
+    """
+    Block until LOCK_FILE is removed. Uses inotify when available so a pause
+    costs no polling; falls back to the stat/sleep loop otherwise.
+    """
+    if INotify is not None:
+        try:
+            with INotify() as inotify:
+                lock_dir = os.path.dirname(os.path.abspath(LOCK_FILE))
+                inotify.add_watch(lock_dir, inotify_flags.DELETE | inotify_flags.MOVED_FROM)
+                # Re-check after arming the watch so a removal in between is not missed
+                while os.path.exists(LOCK_FILE):
+                    inotify.read(timeout=PAUSE_LOCK_INOTIFY_RECHECK_SECONDS * MS_PER_SECOND)
+            return
+        except OSError as e:
+            print(f"    [Remote] inotify unavailable ({e}), polling instead")
+
+    exists = os.path.exists
+    sleep = time.sleep
+    while exists(LOCK_FILE):
+        sleep(PAUSE_LOCK_POLL_INTERVAL_SECONDS)
 
 def check_remote_control(page: Optional[Any] = None) -> bool:
     """Check and execute remote control commands (supports JSON format)"""
     should_run_immediately = False
 
-    # Check command file
-    if os.path.exists(CMD_FILE):
-        with open(CMD_FILE, 'r') as f:
-            raw = f.read().strip()
-        os.remove(CMD_FILE)
+    # An idle tick costs two failing syscalls: rename(CMD_FILE) and
+    # stat(LOCK_FILE). A directory scan would be more (open + getdents +
+    # close) and grows with the files in the working directory.
 
+    # Check command file
+    raw = _claim_command_file()
+    if raw is not None:
         cmd, ts = _parse_command(raw)
         if cmd is None:
             pass  # Command expired, skip
         elif cmd == "update_subscribe":
             print(f"\n[Remote] Command: update_subscribe")
             try:
-                import proxy_helper
-                result = proxy_helper.update_subscription()
+                result = _get_proxy_helper().update_subscription()
                 print(f"       Subscription update: {'success' if result else 'failed'}")
             except Exception as e:
                 print(f"       Subscription update error: {e}")
@@ -258,24 +810,74 @@ def check_remote_control(page: Optional[Any] = None) -> bool:
     # Check pause lock
     if os.path.exists(LOCK_FILE):
         print(f"\n[Remote] Detected {LOCK_FILE}, pausing...")
-        while os.path.exists(LOCK_FILE):
-            time.sleep(PAUSE_LOCK_POLL_INTERVAL_SECONDS)
+        _wait_for_lock_release()
         print("[Remote] Pause ended, resuming!")
         should_run_immediately = True
 
     return should_run_immediately
 
+# Set to cut the current interruptible_sleep() short (SIGUSR1, other threads)
+_wakeup = threading.Event()
+
+def request_wakeup() -> None:
+    """Wake the main loop from interruptible_sleep() now"""
+    _wakeup.set()
+
+def install_wakeup_signal() -> None:
+    """Make SIGUSR1 wake the main loop (POSIX only; call from the main thread)"""
+    if hasattr(signal, "SIGUSR1"):
+        signal.signal(signal.SIGUSR1, lambda signum, frame: request_wakeup())
+
+def interruptible_sleep(seconds: float, watch_remote_control: bool = False) -> bool:
+    """
+    Sleep up to `seconds`, returning early on request_wakeup(). With
+    `watch_remote_control`, also returns once a command/pause file appears
+    (only for callers that run check_remote_control next). Returns True if
+    woken early.
+    """
+    return interruptible_sleep_until(time.monotonic() + seconds, watch_remote_control)
+
+def interruptible_sleep_until(deadline: float, watch_remote_control: bool = False) -> bool:
+    """Like interruptible_sleep(), but until a time.monotonic() deadline"""
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        if _wakeup.wait(min(remaining, REMOTE_CONTROL_WAKE_CHECK_SECONDS)):
+            _wakeup.clear()
+            return True
+        if watch_remote_control and (os.path.exists(CMD_FILE) or os.path.exists(LOCK_FILE)):
+            return True
+
 # ================= Timing Functions (Implement Your Own) =================
 
-def get_wait_time() -> float:
+# Module-private generator (seeded from os.urandom), independent of the global
+# `random` state that user strategies may reseed.
+_rng = random.Random()
+
+def get_wait_time() -> int:
     """
     Get wait time between operations.
 
     IMPLEMENT YOUR OWN TIMING LOGIC HERE.
     This is a simple placeholder implementation.
     """
-    # Simple random wait - replace with your own logic
-    return random.uniform(MIN_WAIT * SECONDS_PER_MINUTE, MAX_WAIT * SECONDS_PER_MINUTE)
+    # Simple random wait (whole seconds) - replace with your own logic
+    return _rng.randrange(_MIN_WAIT_SEC, _MAX_WAIT_SEC + 1)
+
+_noise_table: list = []
+_noise_index = 0
+
+def _next_unit_noise() -> float:
+    """Next uniform [0, 1) sample from a precomputed table, refilled in bulk"""
+    global _noise_table, _noise_index
+    if _noise_index >= len(_noise_table):
+        rand = _rng.random
+        _noise_table = [rand() for _ in range(HUMAN_DELAY_NOISE_TABLE_SIZE)]
+        _noise_index = 0
+    value = _noise_table[_noise_index]
+    _noise_index += 1
+    return value
 
 def human_delay(
     min_sec: float = HUMAN_DELAY_MIN_SECONDS_DEFAULT,
@@ -286,7 +888,7 @@ def human_delay(
 
     IMPLEMENT YOUR OWN DELAY LOGIC HERE.
     """
-    time.sleep(random.uniform(min_sec, max_sec))
+    time.sleep(min_sec + (max_sec - min_sec) * _next_unit_noise())
 
 # ================= Page Operations =================
 
@@ -297,9 +899,10 @@ def safe_click(
     max_wait: float = SAFE_CLICK_MAX_WAIT_SECONDS_DEFAULT,
 ) -> bool:
     """Safe click with wait and error handling"""
+    timeout_ms = max_wait * MS_PER_SECOND
     try:
-        locator.wait_for(state="visible", timeout=max_wait * MS_PER_SECOND)
-        locator.click(timeout=max_wait * MS_PER_SECOND)
+        locator.wait_for(state="visible", timeout=timeout_ms)
+        locator.click(timeout=timeout_ms)
         print(f"    [Action] Clicked: {description}")
         return True
     except Exception as e:
@@ -326,32 +929,97 @@ def wait_for_element_stable(
     Wait for element position to stabilize (animation complete).
     Checks if bounding box remains stable for consecutive checks.
     """
+    # Bind globals/builtins used per iteration to locals
+    now = time.monotonic
+    sleep = time.sleep
+    _abs = abs
+    box_timeout_ms = ELEMENT_STABILITY_BOUNDING_BOX_TIMEOUT_MS
+    required_checks = ELEMENT_STABILITY_REQUIRED_STABLE_CHECKS
+    poll_interval = ELEMENT_STABILITY_POLL_INTERVAL_INITIAL_SECONDS
     last_box = None
     stable_count = 0
-    start = time.time()
+    deadline = now() + timeout
 
-    while time.time() - start < timeout:
+    while now() < deadline:
         try:
-            box = locator.bounding_box(timeout=ELEMENT_STABILITY_BOUNDING_BOX_TIMEOUT_MS)
+            box = locator.bounding_box(timeout=box_timeout_ms)
             if box:
                 if last_box:
-                    dx = abs(box['x'] - last_box['x'])
-                    dy = abs(box['y'] - last_box['y'])
+                    dx = _abs(box['x'] - last_box['x'])
+                    dy = _abs(box['y'] - last_box['y'])
                     if dx < threshold and dy < threshold:
                         stable_count += 1
-                        if stable_count >= ELEMENT_STABILITY_REQUIRED_STABLE_CHECKS:
+                        if stable_count >= required_checks:
                             print(f"       [Stable] Element position stabilized")
                             return True
                     else:
                         stable_count = 0
+                        # Still moving - poll less often
+                        poll_interval = min(
+                            poll_interval * ELEMENT_STABILITY_POLL_BACKOFF_FACTOR,
+                            ELEMENT_STABILITY_POLL_INTERVAL_MAX_SECONDS,
+                        )
                 last_box = box
         except Exception:
             pass
-        time.sleep(ELEMENT_STABILITY_POLL_INTERVAL_SECONDS)
+        sleep(poll_interval)
 
     print(f"       [Timeout] Wait for stable timeout")
     return False
 
+class PagePool:
+    """
+    Round-robin pool of pages sharing one browser context.
+
+    A page is closed and replaced after `max_uses` cycles. The replacement is
+    opened and navigated to `url` when the worn page is rotated out; with more
+    than one page it has a full rotation to load before its turn. Pages only
+    see their own actions, so use size > 1 only for independent workflows.
+    """
+
+    __slots__ = ("_context", "_url", "_max_uses", "_pages", "_uses", "_current")
+
+    def __init__(
+        self,
+        context: Any,
+        url: str,
+        first_page: Optional[Any] = None,
+        size: int = PAGE_POOL_SIZE,
+        max_uses: int = MAX_USES_PER_PAGE,
+    ):
+        self._context = context
+        self._url = url
+        self._max_uses = max_uses
+        self._pages = [first_page] if first_page is not None else []
+        while len(self._pages) < size:
+            self._pages.append(self._open_page())
+        self._uses = [0] * len(self._pages)
+        self._current = len(self._pages) - 1  # first acquire() returns index 0
+
+    def _open_page(self) -> Any:
+        page = self._context.new_page()
+        try:
+            page.goto(self._url, timeout=DEFAULT_TIMEOUT, wait_until="domcontentloaded")
+        except PlaywrightError as e:
+            print(f"    [PagePool] Warm-up navigation failed: {e}")
+        return page
+
+    def acquire(self) -> Any:
+        """Rotate to the next page and return it, recycling the page just left if worn out"""
+        prev = self._current
+        self._current = (prev + 1) % len(self._pages)
+        if self._uses[prev] >= self._max_uses:
+            print(f"    [PagePool] Recycling page after {self._uses[prev]} uses")
+            worn = self._pages[prev]
+            self._pages[prev] = self._open_page()
+            self._uses[prev] = 0
+            try:
+                worn.close()
+            except PlaywrightError:
+                pass
+        self._uses[self._current] += 1
+        return self._pages[self._current]
+
 # ================= Recovery System =================
 
 class RecoveryManager:
@@ -363,6 +1031,20 @@ class RecoveryManager:
     Level C: Process restart
     """
 
+    # Fixed attribute set: slot access is cheaper than __dict__ lookups on the
+    # error path (dataclass(slots=True) would need Python 3.10+).
+    __slots__ = (
+        "error_count_a",
+        "error_count_b",
+        "max_a_errors",
+        "max_b_errors",
+        "last_recovery_level",
+        "a_still_fail_count",
+        "max_a_still_fail",
+        "last_recovery_time",
+        "recovery_cooldown",
+    )
+
     def __init__(self):
         self.error_count_a = 0
         self.error_count_b = 0
@@ -371,7 +1053,7 @@ class RecoveryManager:
         self.last_recovery_level = None
         self.a_still_fail_count = 0
         self.max_a_still_fail = RECOVERY_MAX_A_STILL_FAIL
-        self.last_recovery_time = 0
+        self.last_recovery_time = float("-inf")  # time.monotonic() of last recovery
         self.recovery_cooldown = RECOVERY_COOLDOWN_SECONDS
 
     def recover_level_a(self, page: Any, context: str = "") -> bool:
@@ -405,12 +1087,14 @@ class RecoveryManager:
             "[Bot] Level C Restart Triggered",
             f"Reason: {reason}\nSystem will restart in {RECOVERY_C_RESTART_DELAY_SECONDS} seconds."
         )
+        flush_alerts()
         time.sleep(RECOVERY_C_RESTART_DELAY_SECONDS)
         sys.exit(RECOVERY_RESTART_EXIT_CODE)  # Exit code = needs restart
 
     def handle_error(self, page: Any, error_type: str, context: str = "") -> bool:
         """Unified error handling entry point"""
-        current_time = time.time()
+        # Monotonic: a wall-clock jump must not extend or skip the cooldown
+        current_time = time.monotonic()
 
         if current_time - self.last_recovery_time < self.recovery_cooldown:
             print("    [Recovery] Cooldown active, skipping")
@@ -426,39 +1110,18 @@ class RecoveryManager:
 
         if self.a_still_fail_count >= self.max_a_still_fail:
             print(f"    [Recovery] Level A ineffective {self.a_still_fail_count} times, escalating to Level B")
-            if self.recover_level_b(page, f"Level A ineffective {self.a_still_fail_count} times: {context}"):
-                self.error_count_a = 0
-                self.error_count_b = 0
-                self.a_still_fail_count = 0
-                self.last_recovery_level = "B"
-                self.last_recovery_time = current_time
+            if self._escalate_to_b(page, f"Level A ineffective {self.a_still_fail_count} times: {context}", current_time):
                 return True
-            else:
-                self.error_count_b += 1
-                if self.error_count_b >= self.max_b_errors:
-                    self.trigger_level_c(f"Level B failed {self.error_count_b} times")
-                return False
-
         # Try Level A first
-        if self.recover_level_a(page, context):
-            self.error_count_a = 0
-            self.last_recovery_level = "A"
-            self.last_recovery_time = current_time
+        elif self.recover_level_a(page, context):
+            self._mark_recovered("A", current_time)
             return True
         else:
             self.error_count_a += 1
-
-        # If Level A fails too many times, try Level B
-        if self.error_count_a >= self.max_a_errors:
-            if self.recover_level_b(page, f"Level A failed {self.error_count_a} times"):
-                self.error_count_a = 0
-                self.error_count_b = 0
-                self.a_still_fail_count = 0
-                self.last_recovery_level = "B"
-                self.last_recovery_time = current_time
-                return True
-            else:
-                self.error_count_b += 1
+            # If Level A fails too many times, try Level B
+            if self.error_count_a >= self.max_a_errors:
+                if self._escalate_to_b(page, f"Level A failed {self.error_count_a} times", current_time):
+                    return True
 
         # If Level B also fails, trigger Level C
         if self.error_count_b >= self.max_b_errors:
@@ -466,6 +1129,21 @@ class RecoveryManager:
 
         return False
 
+    def _escalate_to_b(self, page: Any, context: str, current_time: float) -> bool:
+        """Run Level B; record success or count the failure"""
+        if self.recover_level_b(page, context):
+            self._mark_recovered("B", current_time)
+            return True
+        self.error_count_b += 1
+        return False
+
+    def _mark_recovered(self, level: str, current_time: float) -> None:
+        """Apply the counter resets for a successful recovery at `level`"""
+        for counter in RECOVERY_COUNTERS_RESET_ON_SUCCESS[level]:
+            setattr(self, counter, 0)
+        self.last_recovery_level = level
+        self.last_recovery_time = current_time
+
     def reset_counters(self) -> None:
         """Reset error counters after successful operation"""
         self.error_count_a = 0
@@ -485,11 +1163,14 @@ def is_login_required(page: Any) -> bool:
 
     CUSTOMIZE FOR YOUR TARGET SITE.
     """
-    current_url = page.url.lower()
+    # URL + password-field check in a single page round-trip
+    try:
+        return bool(page.evaluate(_IS_LOGIN_REQUIRED_JS))
+    except Exception:
+        pass  # e.g. navigation in flight - fall back to separate checks
 
     # URL patterns that indicate login page
-    login_patterns = ["login", "signin", "auth", "account"]
-    if any(pattern in current_url for pattern in login_patterns):
+    if _LOGIN_URL_RE.search(page.url):
         return True
 
     # Check for password input field
@@ -510,34 +1191,47 @@ def wait_for_login(page: Any, timeout_minutes: float = WAIT_FOR_LOGIN_DEFAULT_TI
     print("\n" + "!" * LOGIN_ALERT_BANNER_WIDTH)
     print("[Alert] Login required...")
 
+    # Save screenshot first so the alert attaches this login's QR code
+    try:
+        page.screenshot(path=QR_IMAGE)
+    except Exception:
+        pass
+
     send_alert_email(
         "[Bot] Login Required",
         f"Please complete login within {WAIT_FOR_LOGIN_DEFAULT_TIMEOUT_MINUTES} minutes.",
         QR_IMAGE
     )
 
-    # Save screenshot
-    try:
-        page.screenshot(path=QR_IMAGE)
-    except Exception:
-        pass
-
-    start_wait = time.time()
-    while time.time() - start_wait < timeout_minutes * SECONDS_PER_MINUTE:
+    now = time.monotonic
+    sleep = time.sleep
+    deadline = now() + timeout_minutes * SECONDS_PER_MINUTE
+    while now() < deadline:
         if not is_login_required(page):
             print("[Success] Login completed!")
             return True
-        time.sleep(LOGIN_POLL_INTERVAL_SECONDS)
+        sleep(LOGIN_POLL_INTERVAL_SECONDS)
 
     return False
 
 # ================= Utility Functions =================
 
+def launch_browser(playwright: Any, **launch_kwargs: Any) -> Any:
+    """
+    Connect to the shared Chromium at PLAYWRIGHT_CDP if set, otherwise
+    launch a private one with `launch_kwargs`. Callers still create their
+    own context, so cookies/storage stay isolated per process.
+    """
+    if PLAYWRIGHT_CDP:
+        print(f"[Browser] Connecting over CDP: {PLAYWRIGHT_CDP}")
+        return playwright.chromium.connect_over_cdp(PLAYWRIGHT_CDP)
+    return playwright.chromium.launch(**launch_kwargs)
+
 def safe_visible(locator: Any, timeout: int = SAFE_VISIBLE_TIMEOUT_MS_DEFAULT) -> bool:
     """Safely check if element is visible"""
     try:
         return locator.is_visible(timeout=timeout)
-    except Exception:
+    except PlaywrightError:
         return False
 
 def safe_wait(locator: Any, state: str = "visible", timeout: int = SAFE_WAIT_TIMEOUT_MS_DEFAULT) -> bool:
@@ -545,5 +1239,5 @@ def safe_wait(locator: Any, state: str = "visible", timeout: int = SAFE_WAIT_TIM
     try:
         locator.wait_for(state=state, timeout=timeout)
         return True
-    except Exception:
+    except PlaywrightError:
         return False
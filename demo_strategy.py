@@ -10,6 +10,7 @@ Run: python demo_strategy.py
 """
 
 import os
+import re
 import sys
 import time
 import random
@@ -24,6 +25,7 @@ from bot_core import (
     safe_click,
     wait_for_element_stable,
     human_delay,
+    launch_browser,
 )
 
 # =============================================================================
@@ -33,6 +35,14 @@ from bot_core import (
 TARGET_URL = "https://httpbin.org/"
 LOG_FILE = "demo_log.txt"
 
+# Selectors used by the actions
+FORMS_LINK_SELECTOR = "a[href='/forms/post']"
+CUSTNAME_SELECTOR = "input[name='custname']"
+CHEESE_SELECTOR = "input[value='cheese']"
+COMMENTS_SELECTOR = "textarea[name='comments']"
+SUBMIT_SELECTOR = "button[type='submit']"
+RESPONSE_SELECTOR = "pre"
+
 # =============================================================================
 # State Definition
 # =============================================================================
@@ -53,6 +63,24 @@ class DemoState(Enum):
 # State Detection
 # =============================================================================
 
+# URL classification in one regex pass; the matching group name is the kind
+URL_STATE_PATTERN = re.compile(r"httpbin\.org/(?:(?P<forms>forms)|(?P<response>post|get))")
+
+# In-page approximation of Playwright's is_visible(), shared by the flag scripts
+JS_VISIBLE_FN = """const visible = (el) => !!el && el.getClientRects().length > 0
+        && getComputedStyle(el).visibility !== 'hidden';"""
+
+# Visibility of every element detect_state cares about, in one evaluate call
+STATE_FLAGS_JS = """() => {
+    """ + JS_VISIBLE_FN + """
+    return {
+        pre: visible(document.querySelector('pre')),
+        formsLink: visible(document.querySelector("a[href='/forms/post']")),
+        httpbin: !!document.body && /httpbin/i.test(document.body.innerText),
+    };
+}"""
+
+
 def detect_state(page: Page) -> DemoState:
     """
     Detect current page state by checking visible elements.
@@ -63,21 +91,25 @@ def detect_state(page: Page) -> DemoState:
     - Keep detection logic simple and fast
     """
     try:
-        url = page.url
+        url_match = URL_STATE_PATTERN.search(page.url)
+        url_kind = url_match.lastgroup if url_match else None
 
         # Check URL patterns first (fast path)
-        if "httpbin.org/forms" in url:
+        if url_kind == "forms":
             return DemoState.FORMS_PAGE
 
-        if "httpbin.org/post" in url or "httpbin.org/get" in url:
+        # Collect all element checks in a single page round-trip
+        flags = page.evaluate(STATE_FLAGS_JS)
+
+        if url_kind == "response":
             # Check if we see JSON response
-            if page.locator("pre").is_visible(timeout=1000):
+            if flags["pre"]:
                 return DemoState.RESPONSE_PAGE
 
         # Check homepage elements
-        if page.locator("text=httpbin").first.is_visible(timeout=1000):
+        if flags["httpbin"]:
             # Look for the forms link to confirm we're on home
-            if page.locator("a[href='/forms/post']").is_visible(timeout=500):
+            if flags["formsLink"]:
                 return DemoState.HOME
 
         return DemoState.UNKNOWN
@@ -99,7 +131,7 @@ def action_go_to_forms(page: Page, recovery_manager: Optional[RecoveryManager] =
 
     try:
         # Find and click the forms link
-        forms_link = page.locator("a[href='/forms/post']")
+        forms_link = page.locator(FORMS_LINK_SELECTOR)
 
         if not forms_link.is_visible(timeout=3000):
             print("[Action] Forms link not found")
@@ -107,8 +139,8 @@ def action_go_to_forms(page: Page, recovery_manager: Optional[RecoveryManager] =
 
         # Use safe_click for reliable clicking
         if safe_click(page, forms_link, "Forms Link"):
-            # Wait for navigation
-            page.wait_for_load_state("networkidle", timeout=10000)
+            # Wait until the form is usable rather than for network idle
+            page.locator(CUSTNAME_SELECTOR).wait_for(state="visible", timeout=10000)
             human_delay(0.5, 1.0)
             return True
 
@@ -119,6 +151,19 @@ def action_go_to_forms(page: Page, recovery_manager: Optional[RecoveryManager] =
         return False
 
 
+# Visibility/checked state of the form controls, in one evaluate call
+FORM_FLAGS_JS = """() => {
+    """ + JS_VISIBLE_FN + """
+    const cheese = document.querySelector("input[value='cheese']");
+    return {
+        custname: visible(document.querySelector("input[name='custname']")),
+        cheese: visible(cheese),
+        cheeseChecked: !!cheese && cheese.checked,
+        comments: visible(document.querySelector("textarea[name='comments']")),
+    };
+}"""
+
+
 def action_submit_form(page: Page, recovery_manager: Optional[RecoveryManager] = None) -> bool:
     """
     Action: Fill and submit the form on FORMS page.
@@ -126,29 +171,29 @@ def action_submit_form(page: Page, recovery_manager: Optional[RecoveryManager] =
     print("[Action] Filling and submitting form...")
 
     try:
+        # Snapshot which fields are present in one round-trip
+        flags = page.evaluate(FORM_FLAGS_JS)
+
         # Fill form fields
-        customer_input = page.locator("input[name='custname']")
-        if customer_input.is_visible(timeout=2000):
-            customer_input.fill(f"Demo User {random.randint(100, 999)}")
+        if flags["custname"]:
+            page.locator(CUSTNAME_SELECTOR).fill(f"Demo User {random.randint(100, 999)}")
             human_delay(0.3, 0.6)
 
         # Select topping (checkbox)
-        cheese_checkbox = page.locator("input[value='cheese']")
-        if cheese_checkbox.is_visible(timeout=1000):
-            if not cheese_checkbox.is_checked():
-                cheese_checkbox.click()
-                human_delay(0.2, 0.4)
+        if flags["cheese"] and not flags["cheeseChecked"]:
+            page.locator(CHEESE_SELECTOR).click()
+            human_delay(0.2, 0.4)
 
         # Fill comments
-        comments = page.locator("textarea[name='comments']")
-        if comments.is_visible(timeout=1000):
-            comments.fill("This is a demo submission from Strategy Bot Template")
+        if flags["comments"]:
+            page.locator(COMMENTS_SELECTOR).fill("This is a demo submission from Strategy Bot Template")
             human_delay(0.3, 0.5)
 
         # Submit form
-        submit_btn = page.locator("button[type='submit']")
+        submit_btn = page.locator(SUBMIT_SELECTOR)
         if safe_click(page, submit_btn, "Submit Button"):
-            page.wait_for_load_state("networkidle", timeout=10000)
+            # The response page renders its echo in a <pre>
+            page.locator(RESPONSE_SELECTOR).wait_for(state="visible", timeout=10000)
             human_delay(0.5, 1.0)
             return True
 
@@ -167,7 +212,7 @@ def action_go_home(page: Page, recovery_manager: Optional[RecoveryManager] = Non
 
     try:
         page.goto(TARGET_URL, timeout=15000)
-        page.wait_for_load_state("networkidle", timeout=10000)
+        page.locator(FORMS_LINK_SELECTOR).wait_for(state="visible", timeout=10000)
         human_delay(0.5, 1.0)
         return True
 
@@ -180,6 +225,19 @@ def action_go_home(page: Page, recovery_manager: Optional[RecoveryManager] = Non
 # Strategy Logic
 # =============================================================================
 
+# State -> (action, log message). States not listed here are unhandled.
+STATE_ACTIONS = {
+    # From home, go to forms
+    DemoState.HOME: (action_go_to_forms, "[Strategy] On homepage -> Going to forms"),
+    # On forms page, submit form
+    DemoState.FORMS_PAGE: (action_submit_form, "[Strategy] On forms page -> Submitting form"),
+    # Saw response, go back home
+    DemoState.RESPONSE_PAGE: (action_go_home, "[Strategy] Saw response -> Returning home"),
+    # Unknown state, try to recover
+    DemoState.UNKNOWN: (action_go_home, "[Strategy] Unknown state -> Attempting recovery"),
+}
+
+
 def run_strategy(page: Page, recovery_manager: RecoveryManager, logger: DualLogger) -> bool:
     """
     Main strategy loop - the brain of your bot.
@@ -196,26 +254,11 @@ def run_strategy(page: Page, recovery_manager: RecoveryManager, logger: DualLogg
     logger.log(f"[Strategy] Current state: {state.value}")
 
     # Step 2 & 3: State-based action
-    if state == DemoState.HOME:
-        # From home, go to forms
-        logger.log("[Strategy] On homepage -> Going to forms")
-        success = action_go_to_forms(page, recovery_manager)
-
-    elif state == DemoState.FORMS_PAGE:
-        # On forms page, submit form
-        logger.log("[Strategy] On forms page -> Submitting form")
-        success = action_submit_form(page, recovery_manager)
-
-    elif state == DemoState.RESPONSE_PAGE:
-        # Saw response, go back home
-        logger.log("[Strategy] Saw response -> Returning home")
-        success = action_go_home(page, recovery_manager)
-
-    elif state == DemoState.UNKNOWN:
-        # Unknown state, try to recover
-        logger.log("[Strategy] Unknown state -> Attempting recovery")
-        success = action_go_home(page, recovery_manager)
-
+    handler = STATE_ACTIONS.get(state)
+    if handler is not None:
+        action, message = handler
+        logger.log(message)
+        success = action(page, recovery_manager)
     else:
         logger.log(f"[Strategy] Unhandled state: {state.value}")
         success = False
@@ -249,8 +292,8 @@ def main() -> None:
     recovery_manager = RecoveryManager()
 
     with sync_playwright() as p:
-        # Launch browser (visible for demo)
-        browser = p.chromium.launch(headless=False)
+        # Launch browser (visible for demo), or attach to PLAYWRIGHT_CDP
+        browser = launch_browser(p, headless=False)
         context = browser.new_context(
             viewport={"width": 1280, "height": 800},
             user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
@@ -260,8 +303,8 @@ def main() -> None:
         try:
             # Navigate to target
             logger.log(f"[Demo] Opening {TARGET_URL}")
-            page.goto(TARGET_URL, timeout=30000)
-            page.wait_for_load_state("networkidle")
+            page.goto(TARGET_URL, timeout=30000, wait_until="domcontentloaded")
+            page.locator(FORMS_LINK_SELECTOR).wait_for(state="visible", timeout=5000)
 
             # Run demo cycles
             cycles = 3
@@ -7,23 +7,42 @@ Supports: Clash, Clash Verge, V2Ray, etc. (via RESTful API)
 """
 
 import json
+import atexit
+import functools
+import hashlib
+import http.client
+import urllib.error
 import urllib.request
 import urllib.parse
 import time
 import os
 import threading
 import datetime
+import zlib
+import statistics
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple, Optional
 from enum import Enum
 
+# Optional: orjson parses API responses (bytes) several times faster than json.
+# Its decode error subclasses json.JSONDecodeError/ValueError.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 # Import utilities from bot_core
-from bot_core import atomic_write, safe_read_json, mask_url, SUBSCRIBE_URL_FILE, SUBSCRIBE_STATUS_FILE
+from bot_core import (
+    atomic_write, safe_read_json, mask_url, install_wakeup_signal, interruptible_sleep,
+    SUBSCRIBE_URL_FILE, SUBSCRIBE_STATUS_FILE,
+)
 
 # ================= Configuration =================
 
 # Proxy API configuration (set via environment variables)
 PROXY_PORT = os.environ.get('PROXY_PORT', '9090')
-API_URL = f"http://127.0.0.1:{PROXY_PORT}"
+API_HOST = "127.0.0.1"
+API_URL = f"http://{API_HOST}:{PROXY_PORT}"
 API_SECRET = os.environ.get('PROXY_SECRET', "")
 
 # Subscription URL (default, can be overridden by subscribe_url.txt)
@@ -34,17 +53,35 @@ _subscribe_lock = threading.Lock()
 _last_subscribe_update = 0
 MIN_SUBSCRIBE_INTERVAL = 30  # seconds
 
+# Subscription download: read in chunks and give up early if the first
+# SUBSCRIBE_VALIDATE_MAX_BYTES (decoded) contain none of the markers
+SUBSCRIBE_READ_CHUNK_BYTES = 8192
+SUBSCRIBE_VALIDATE_MAX_BYTES = 64 * 1024
+SUBSCRIBE_VALID_MARKERS = (b"proxies:", b"port:")
+
+# ((st_ino, st_mtime_ns, st_size), stripped contents) of subscribe_url.txt
+_sub_url_cache: Optional[Tuple[Tuple[int, int, int], str]] = None
+
 def get_sub_url():
     """
-    Dynamically get subscription URL (read latest value each time).
+    Dynamically get subscription URL (re-read only when the file changes).
     Priority: subscribe_url.txt > environment variable > default
     """
+    global _sub_url_cache
     try:
-        if os.path.exists(SUBSCRIBE_URL_FILE):
+        st = os.stat(SUBSCRIBE_URL_FILE)
+        key = (st.st_ino, st.st_mtime_ns, st.st_size)
+        cached = _sub_url_cache
+        if cached is not None and cached[0] == key:
+            url = cached[1]
+        else:
             with open(SUBSCRIBE_URL_FILE, 'r', encoding='utf-8') as f:
                 url = f.read().strip()
-                if url:
-                    return url
+            _sub_url_cache = (key, url)
+        if url:
+            return url
+    except FileNotFoundError:
+        _sub_url_cache = None
     except Exception as e:
         print(f"    [Subscription] Failed to read file: {e}")
     return DEFAULT_SUB_URL
@@ -59,6 +96,25 @@ TEST_URLS = [
 # Timeout configuration
 DELAY_TIMEOUT = 4000  # ms
 REQUEST_TIMEOUT = 5   # seconds
+API_CONNECT_TIMEOUT = 1  # seconds, loopback connect should be near-instant
+
+# Upper bound on concurrent node probes in try_fix_network
+NODE_PROBE_MAX_WORKERS = 8
+
+# Idle keep-alive connections kept open to the proxy API (covers the probe fan-out)
+API_POOL_MAX_IDLE = 8
+
+# How long a /proxies snapshot is reused within one health-check cycle
+PROXY_GROUPS_CACHE_TTL = 2.0  # seconds
+
+# Monitoring mode (python proxy_helper.py): re-check interval when healthy, and
+# the unhealthy backoff that doubles per consecutive failure up to the max
+MONITOR_HEALTHY_INTERVAL = 180  # seconds
+MONITOR_UNHEALTHY_BACKOFF_INITIAL = 30  # seconds
+MONITOR_UNHEALTHY_BACKOFF_MAX = 600  # seconds
+
+# Divider printed at the start of every health check
+HEALTH_LOG_DIVIDER = "=" * 50
 
 # ================= Health Status =================
 
@@ -76,35 +132,130 @@ HEALTH_THRESHOLDS = {
     "DEGRADED": 1500,
 }
 
+# (upper bound, status) in ascending order; anything above the last is UNHEALTHY
+_STATUS_BY_THRESHOLD = tuple(
+    (HEALTH_THRESHOLDS[status.name], status)
+    for status in (HealthStatus.EXCELLENT, HealthStatus.HEALTHY, HealthStatus.DEGRADED)
+)
+
 # ================= API Helper =================
 
-def _build_request(url: str, method: str = "GET", data: Optional[bytes] = None):
-    """Build HTTP request with optional authentication"""
-    req = urllib.request.Request(url, data=data, method=method)
-    if API_SECRET:
-        req.add_header("Authorization", f"Bearer {API_SECRET}")
-    if data is not None:
-        req.add_header("Content-Type", "application/json")
-    return req
+class _APIConnection(http.client.HTTPConnection):
+    """HTTPConnection that fails fast when the API port is not accepting connections"""
+
+    def connect(self):
+        # http.client already sets TCP_NODELAY on the socket
+        read_timeout = self.timeout
+        self.timeout = API_CONNECT_TIMEOUT
+        try:
+            super().connect()
+        finally:
+            self.timeout = read_timeout
+        self.sock.settimeout(read_timeout)
+
+# Failures that mean "this probe failed" (socket/timeout/HTTP status/bad JSON)
+_PROBE_ERRORS = (OSError, http.client.HTTPException, ValueError)
+
+class _APIConnectionPool:
+    """
+    Keep-alive HTTP connections to the local proxy API.
+
+    Each request checks a connection out and returns it afterwards, so
+    concurrent probes get their own sockets while sequential calls reuse one
+    instead of paying a TCP connect + teardown every time.
+    """
+
+    def __init__(self, host: str, port: int):
+        self._host = host
+        self._port = port
+        self._idle: List[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+
+    def _checkout(self) -> http.client.HTTPConnection:
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        return _APIConnection(self._host, self._port, timeout=REQUEST_TIMEOUT)
+
+    def _checkin(self, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            if len(self._idle) < API_POOL_MAX_IDLE:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def request(self, method: str, path: str, body: Optional[bytes] = None) -> bytes:
+        """Send a request and return the response body; raises HTTPError on 4xx/5xx"""
+        headers = {}
+        if API_SECRET:
+            headers["Authorization"] = f"Bearer {API_SECRET}"
+        if body is not None:
+            headers["Content-Type"] = "application/json"
+
+        conn = self._checkout()
+        reused = conn.sock is not None
+        try:
+            try:
+                conn.request(method, path, body=body, headers=headers)
+                res = conn.getresponse()
+            except (http.client.HTTPException, ConnectionError):
+                if not reused:
+                    raise
+                # The API closed an idle keep-alive socket; retry once on a fresh one
+                conn.close()
+                conn.request(method, path, body=body, headers=headers)
+                res = conn.getresponse()
+            data = res.read()
+        except Exception:
+            conn.close()
+            raise
+
+        if res.will_close:
+            conn.close()
+        else:
+            self._checkin(conn)
+
+        if res.status >= 400:
+            raise urllib.error.HTTPError(f"{API_URL}{path}", res.status, res.reason, res.headers, None)
+        return data
+
+    def close(self) -> None:
+        """Close all idle connections (registered with atexit)"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+
+_api_pool = _APIConnectionPool(API_HOST, int(PROXY_PORT))
+atexit.register(_api_pool.close)
 
 # ================= Health Check =================
 
+# "/delay?..." query per test URL, built once (the node part is cached below)
+_DELAY_QUERY_BY_URL = {
+    url: f"/delay?timeout={DELAY_TIMEOUT}&url={urllib.parse.quote(url, safe='')}"
+    for url in TEST_URLS
+}
+
+@functools.lru_cache(maxsize=256)
+def _proxy_path(name: str) -> str:
+    # Node/group names repeat every probe and cycle; quote each once
+    return f"/proxies/{urllib.parse.quote(name)}"
+
 def test_single_url(node_name: str, url: str) -> int:
     """
     Test latency to a single URL through specified node.
     Returns latency in ms, or 0 if failed.
     """
     try:
-        test_url = (
-            f"{API_URL}/proxies/{urllib.parse.quote(node_name)}"
-            f"/delay?timeout={DELAY_TIMEOUT}&url={url}"
-        )
-        req = _build_request(test_url)
-
-        with urllib.request.urlopen(req, timeout=REQUEST_TIMEOUT) as res:
-            res_data = json.loads(res.read().decode())
-            return int(res_data.get("delay", 0))
-    except Exception:
+        query = _DELAY_QUERY_BY_URL.get(url)
+        if query is None:
+            query = f"/delay?timeout={DELAY_TIMEOUT}&url={urllib.parse.quote(url, safe='')}"
+        path = _proxy_path(node_name) + query
+        res_data = _json_loads(_api_pool.request("GET", path))
+        return int(res_data.get("delay", 0))
+    except _PROBE_ERRORS:
         return 0
 
 def multi_point_test(node_name: str) -> Tuple[int, HealthStatus]:
@@ -112,11 +263,11 @@ def multi_point_test(node_name: str) -> Tuple[int, HealthStatus]:
     Test node with multiple URLs.
     Returns: (median_latency, health_status)
     """
-    results = []
+    # Probes are independent, run them concurrently (results keep TEST_URLS order)
+    with ThreadPoolExecutor(max_workers=len(TEST_URLS)) as executor:
+        results = list(executor.map(lambda url: test_single_url(node_name, url), TEST_URLS))
 
-    for url in TEST_URLS:
-        latency = test_single_url(node_name, url)
-        results.append(latency)
+    for url, latency in zip(TEST_URLS, results):
         print(f"        {url}: {latency}ms" if latency > 0 else f"        {url}: failed")
 
     # Calculate health
@@ -129,56 +280,73 @@ def multi_point_test(node_name: str) -> Tuple[int, HealthStatus]:
 
     # Rule 2: Use median for status
     if valid_latencies:
-        valid_latencies.sort()
-        median = valid_latencies[len(valid_latencies) // 2]
-
-        if median < HEALTH_THRESHOLDS["EXCELLENT"]:
-            return median, HealthStatus.EXCELLENT
-        elif median < HEALTH_THRESHOLDS["HEALTHY"]:
-            return median, HealthStatus.HEALTHY
-        elif median < HEALTH_THRESHOLDS["DEGRADED"]:
-            return median, HealthStatus.DEGRADED
-        else:
-            return median, HealthStatus.UNHEALTHY
+        median = statistics.median_high(valid_latencies)
+        status = next((s for limit, s in _STATUS_BY_THRESHOLD if median < limit), HealthStatus.UNHEALTHY)
+        return median, status
 
     return 9999, HealthStatus.UNHEALTHY
 
 # ================= Proxy Management =================
 
-def get_proxy_groups() -> Optional[Dict]:
-    """Get all proxy groups from API"""
+# (monotonic fetch time, proxies dict, Selector groups) of the last successful /proxies read
+_proxy_groups_cache: Optional[Tuple[float, Dict, List[Tuple[str, Dict]]]] = None
+
+def _invalidate_proxy_groups() -> None:
+    global _proxy_groups_cache
+    _proxy_groups_cache = None
+
+def _proxy_groups_snapshot() -> Optional[Tuple[float, Dict, List[Tuple[str, Dict]]]]:
+    """Cached /proxies entry, refetched after PROXY_GROUPS_CACHE_TTL; None on error"""
+    global _proxy_groups_cache
+    cached = _proxy_groups_cache
+    now = time.monotonic()
+    if cached is not None and now - cached[0] < PROXY_GROUPS_CACHE_TTL:
+        return cached
+
     try:
-        url = f"{API_URL}/proxies"
-        req = _build_request(url)
-        with urllib.request.urlopen(req, timeout=REQUEST_TIMEOUT) as res:
-            data = json.loads(res.read().decode())
-        return data.get("proxies", {})
+        data = _json_loads(_api_pool.request("GET", "/proxies"))
+        proxies = data.get("proxies", {})
+        # Selector groups are a handful among possibly hundreds of proxies; pick them out once
+        selectors = [
+            (name, info) for name, info in proxies.items()
+            if isinstance(info, dict) and info.get("type") == "Selector"
+        ]
+        _proxy_groups_cache = (now, proxies, selectors)
+        return _proxy_groups_cache
     except Exception as e:
         print(f"    [Error] Failed to get proxy groups: {e}")
         return None
 
+def get_proxy_groups() -> Optional[Dict]:
+    """Get all proxy groups from API (cached for PROXY_GROUPS_CACHE_TTL)"""
+    snapshot = _proxy_groups_snapshot()
+    return snapshot[1] if snapshot is not None else None
+
+def get_selector_groups() -> Optional[List[Tuple[str, Dict]]]:
+    """(name, info) of every Selector group, from the cached /proxies snapshot"""
+    snapshot = _proxy_groups_snapshot()
+    if snapshot is None or not snapshot[1]:
+        return None
+    return snapshot[2]
+
 def get_current_node() -> Optional[str]:
     """Get currently selected proxy node"""
-    proxies = get_proxy_groups()
-    if not proxies:
+    groups = get_selector_groups()
+    if not groups:
         return None
 
-    # Find main selector group
-    for name, info in proxies.items():
-        if isinstance(info, dict) and info.get("type") == "Selector":
-            return info.get("now")
-
-    return None
+    # Main selector group is the first one
+    return groups[0][1].get("now")
 
 def switch_node(group_name: str, node_name: str) -> bool:
     """Switch to specified node in a group"""
     try:
-        url = f"{API_URL}/proxies/{urllib.parse.quote(group_name)}"
+        path = _proxy_path(group_name)
         data = json.dumps({"name": node_name}).encode("utf-8")
-        req = _build_request(url, method="PUT", data=data)
-        with urllib.request.urlopen(req, timeout=REQUEST_TIMEOUT):
-            print(f"    [Success] Switched to: {node_name}")
-            return True
+        _api_pool.request("PUT", path, body=data)
+        _invalidate_proxy_groups()
+        print(f"    [Success] Switched to: {node_name}")
+        return True
     except Exception as e:
         print(f"    [Error] Failed to switch node: {e}")
         return False
@@ -186,10 +354,12 @@ def switch_node(group_name: str, node_name: str) -> bool:
 def get_available_nodes(group_name: str) -> List[str]:
     """Get all available nodes in a group"""
     try:
-        url = f"{API_URL}/proxies/{urllib.parse.quote(group_name)}"
-        req = _build_request(url)
-        with urllib.request.urlopen(req, timeout=REQUEST_TIMEOUT) as res:
-            data = json.loads(res.read().decode())
+        # /proxies already carries each group's member list; fetch the group only on a miss
+        proxies = get_proxy_groups() or {}
+        data = proxies.get(group_name)
+        if not isinstance(data, dict) or "all" not in data:
+            path = _proxy_path(group_name)
+            data = _json_loads(_api_pool.request("GET", path))
 
         all_nodes = data.get("all", []) or []
         # Filter out special entries
@@ -205,7 +375,7 @@ def check_health() -> Tuple[str, int, bool]:
     Check current network health.
     Returns: (node_name, latency_ms, is_healthy)
     """
-    print("\n" + "=" * 50)
+    print("\n" + HEALTH_LOG_DIVIDER)
     print(f"[Health Check] {time.strftime('%Y-%m-%d %H:%M:%S')}")
 
     node_name = get_current_node()
@@ -229,28 +399,34 @@ def try_fix_network() -> bool:
     """
     print("\n[Network Fix] Attempting to fix network...")
 
-    proxies = get_proxy_groups()
-    if not proxies:
+    groups = get_selector_groups()
+    if groups is None:
         return False
 
-    # Find selector groups
-    for name, info in proxies.items():
-        if isinstance(info, dict) and info.get("type") == "Selector":
-            nodes = get_available_nodes(name)
-            current = info.get("now")
-
-            # Try other nodes
-            for node in nodes:
-                if node == current:
-                    continue
-
-                print(f"    [Trying] {node}")
-                latency = test_single_url(node, TEST_URLS[0])
-
-                if latency > 0 and latency < HEALTH_THRESHOLDS["HEALTHY"]:
-                    if switch_node(name, node):
-                        print(f"    [Fixed] Switched to {node} ({latency}ms)")
-                        return True
+    # Try each selector group
+    for name, info in groups:
+        nodes = get_available_nodes(name)
+        current = info.get("now")
+
+        candidates = [node for node in nodes if node != current]
+        if not candidates:
+            continue
+
+        # Probe in parallel batches, in the original node order; stop at the
+        # first batch that yields a node we can switch to
+        print(f"    [Trying] {len(candidates)} nodes in {name}")
+        workers = min(NODE_PROBE_MAX_WORKERS, len(candidates))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for start in range(0, len(candidates), workers):
+                batch = candidates[start:start + workers]
+                latencies = executor.map(lambda node: test_single_url(node, TEST_URLS[0]), batch)
+
+                for node, latency in zip(batch, latencies):
+                    print(f"        {node}: {latency}ms" if latency > 0 else f"        {node}: failed")
+                    if latency > 0 and latency < HEALTH_THRESHOLDS["HEALTHY"]:
+                        if switch_node(name, node):
+                            print(f"    [Fixed] Switched to {node} ({latency}ms)")
+                            return True
 
     print("    [Failed] Could not find healthy node")
     return False
@@ -261,19 +437,73 @@ def get_mixed_port() -> int:
 
 # ================= Subscription Update =================
 
-def _write_subscribe_status(success: bool, url: str, error: str = None):
-    """Write subscription update status (atomic write)"""
+def _url_digest(url: str) -> str:
+    # Identifies the subscription in the status file without storing its token
+    return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+def _read_subscribe_validators(url: str) -> Tuple[Optional[str], Optional[str]]:
+    """(ETag, Last-Modified) saved by the last successful download of `url`"""
+    status = safe_read_json(SUBSCRIBE_STATUS_FILE, {})
+    if not isinstance(status, dict) or status.get("url_sha256") != _url_digest(url):
+        return None, None
+    return status.get("etag"), status.get("last_modified")
+
+def _write_subscribe_status(
+    success: bool,
+    url: str,
+    error: str = None,
+    validators: Tuple[Optional[str], Optional[str]] = (None, None),
+):
+    """Write subscription update status (status cache, non-durable write)"""
+    etag, last_modified = validators
     status = {
         "last_update": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
         "success": success,
         "url_preview": mask_url(url),
-        "error": error
+        "error": error,
+        # Conditional GET validators for the next download
+        "url_sha256": _url_digest(url),
+        "etag": etag,
+        "last_modified": last_modified,
     }
     try:
-        atomic_write(SUBSCRIBE_STATUS_FILE, json.dumps(status, ensure_ascii=False, indent=2))
+        atomic_write(SUBSCRIBE_STATUS_FILE, json.dumps(status, ensure_ascii=False, indent=2), durable=False)
     except Exception as e:
         print(f"    [Subscription] Failed to write status: {e}")
 
+def _read_subscription(response) -> Optional[bytes]:
+    """
+    Read a subscription body in chunks, gunzipping if the server compressed it.
+    Returns None as soon as the content is known to be invalid.
+    """
+    decoder = None
+    if response.headers.get("Content-Encoding", "").lower() == "gzip":
+        decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+    # Keep the last few bytes of each chunk so a marker split across chunks is found
+    overlap = max(len(m) for m in SUBSCRIBE_VALID_MARKERS) - 1
+    chunks = []
+    tail = b""
+    scanned = 0
+    valid = False
+
+    while True:
+        raw = response.read(SUBSCRIBE_READ_CHUNK_BYTES)
+        data = (decoder.decompress(raw) if raw else decoder.flush()) if decoder else raw
+        if data:
+            chunks.append(data)
+            if not valid:
+                window = tail + data
+                valid = any(m in window for m in SUBSCRIBE_VALID_MARKERS)
+                scanned += len(data)
+                if not valid and scanned >= SUBSCRIBE_VALIDATE_MAX_BYTES:
+                    return None
+                tail = window[-overlap:]
+        if not raw:
+            break
+
+    return b"".join(chunks) if valid else None
+
 def update_subscription() -> bool:
     """
     Update proxy subscription with debounce and locking.
@@ -298,32 +528,49 @@ def update_subscription() -> bool:
         _subscribe_lock.release()
         return False
 
+    # Kept across failures so the next poll can still be conditional
+    validators = _read_subscribe_validators(sub_url)
+
     try:
         _last_subscribe_update = now
         print(f"    [Subscription] Downloading: {mask_url(sub_url)}")
 
         req = urllib.request.Request(sub_url)
         req.add_header("User-Agent", "ProxyHelper/1.0")
+        req.add_header("Accept-Encoding", "gzip")
+        etag, last_modified = validators
+        if etag:
+            req.add_header("If-None-Match", etag)
+        if last_modified:
+            req.add_header("If-Modified-Since", last_modified)
+
+        # Validated while streaming; an invalid body is abandoned early
+        try:
+            with urllib.request.urlopen(req, timeout=20) as response:
+                content = _read_subscription(response)
+                new_validators = (response.headers.get("ETag"), response.headers.get("Last-Modified"))
+        except urllib.error.HTTPError as e:
+            if e.code != 304:
+                raise
+            print("    [Subscription] Not modified since last download")
+            _write_subscribe_status(True, sub_url, validators=validators)
+            return True
 
-        with urllib.request.urlopen(req, timeout=20) as response:
-            content = response.read()
-
-        # Validate content
-        if b"proxies:" not in content and b"port:" not in content:
+        if content is None:
             print("    [Subscription] Invalid content")
-            _write_subscribe_status(False, sub_url, "Invalid content")
+            _write_subscribe_status(False, sub_url, "Invalid content", validators)
             return False
 
         # Reload config via API
         url = f"{API_URL}/configs?force=true"
         # Note: This requires proper config path - customize as needed
         print("    [Subscription] Config downloaded successfully")
-        _write_subscribe_status(True, sub_url)
+        _write_subscribe_status(True, sub_url, validators=new_validators)
         return True
 
     except Exception as e:
         print(f"    [Subscription] Update failed: {e}")
-        _write_subscribe_status(False, sub_url, str(e))
+        _write_subscribe_status(False, sub_url, str(e), validators)
         return False
     finally:
         _subscribe_lock.release()
@@ -344,22 +591,30 @@ if __name__ == "__main__":
     else:
         # Continuous monitoring mode
         print("==== Proxy Helper - Monitoring Mode ====")
-        print("Press Ctrl+C to stop")
+        print("Press Ctrl+C to stop (SIGUSR1 triggers an immediate check)")
+        install_wakeup_signal()
+        backoff = MONITOR_UNHEALTHY_BACKOFF_INITIAL
 
         while True:
             try:
                 node, latency, is_healthy = check_health()
-                if not is_healthy:
-                    try_fix_network()
-
-                # Wait before next check
-                wait_time = 180 if is_healthy else 30
+                if not is_healthy and try_fix_network():
+                    # Switched nodes: re-check soon, without escalating
+                    backoff = MONITOR_UNHEALTHY_BACKOFF_INITIAL
+
+                # Wait before next check; back off while the network stays unhealthy
+                if is_healthy:
+                    wait_time = MONITOR_HEALTHY_INTERVAL
+                    backoff = MONITOR_UNHEALTHY_BACKOFF_INITIAL
+                else:
+                    wait_time = backoff
+                    backoff = min(backoff * 2, MONITOR_UNHEALTHY_BACKOFF_MAX)
                 print(f"\n[Sleep] {wait_time} seconds until next check...")
-                time.sleep(wait_time)
+                interruptible_sleep(wait_time)
 
             except KeyboardInterrupt:
                 print("\n[Exit] User interrupted")
                 break
             except Exception as e:
                 print(f"\n[Error] {e}")
-                time.sleep(30)
+                interruptible_sleep(30)
@@ -23,6 +23,8 @@ if TYPE_CHECKING:
 # Width of divider lines used in console logging.
 STRATEGY_LOG_DIVIDER_WIDTH = 50
 STARTUP_LOG_DIVIDER_WIDTH = 60
+STRATEGY_LOG_DIVIDER = "=" * STRATEGY_LOG_DIVIDER_WIDTH
+STARTUP_LOG_DIVIDER = "=" * STARTUP_LOG_DIVIDER_WIDTH
 
 # Delay range (seconds) used when the bot is in a PENDING state.
 PENDING_STATE_DELAY_MIN_SECONDS = 2
@@ -31,11 +33,24 @@ PENDING_STATE_DELAY_MAX_SECONDS = 5
 # Latency sentinel (ms) returned when a network health check fails.
 UNKNOWN_LATENCY_MS = -1
 
-# Sleep (seconds) after initial navigation to allow the page to settle.
-POST_NAVIGATION_SLEEP_SECONDS = 3
+# Chromium flags for a long-running bot (several also in Playwright's defaults).
+# No --disable-features: a second copy would replace Playwright's own list.
+CHROMIUM_LAUNCH_ARGS = (
+    '--disable-blink-features=AutomationControlled',
+    '--disable-background-networking',
+    '--disable-background-timer-throttling',
+    '--disable-backgrounding-occluded-windows',
+    '--disable-renderer-backgrounding',
+    '--disable-sync',
+    '--metrics-recording-only',
+    '--no-first-run',
+    '--no-default-browser-check',
+)
 
 # Backoff (seconds) when network is unhealthy or an unhandled error occurs.
+# The unhealthy wait doubles per consecutive failure, up to the max.
 NETWORK_UNHEALTHY_RETRY_SLEEP_SECONDS = 30
+NETWORK_UNHEALTHY_RETRY_MAX_SLEEP_SECONDS = 600
 UNHANDLED_ERROR_RETRY_SLEEP_SECONDS = 30
 
 # Note: bot_core/proxy_helper imports are intentionally done inside main()
@@ -126,7 +141,7 @@ def run_strategy(page: "Page", recovery_manager: "RecoveryManager") -> None:
 
     IMPLEMENT YOUR OWN STRATEGY HERE.
     """
-    print("\n" + "=" * STRATEGY_LOG_DIVIDER_WIDTH)
+    print("\n" + STRATEGY_LOG_DIVIDER)
     print(f"[Strategy] Running at {time.strftime('%Y-%m-%d %H:%M:%S')}")
 
     # Check remote control
@@ -203,12 +218,17 @@ def main() -> None:
     load_dotenv()
 
     global DualLogger
+    global PagePool
     global RecoveryManager
     global TARGET_URL
     global check_remote_control
     global get_wait_time
     global human_delay
+    global install_wakeup_signal
+    global interruptible_sleep
+    global interruptible_sleep_until
     global is_login_required
+    global launch_browser
     global update_monitor
     global wait_for_login
     global proxy_helper
@@ -216,12 +236,17 @@ def main() -> None:
     # Import core utilities after environment is loaded
     from bot_core import (
         DualLogger,
+        PagePool,
         RecoveryManager,
         TARGET_URL,
         check_remote_control,
         get_wait_time,
         human_delay,
+        install_wakeup_signal,
+        interruptible_sleep,
+        interruptible_sleep_until,
         is_login_required,
+        launch_browser,
         update_monitor,
         wait_for_login,
     )
@@ -231,20 +256,22 @@ def main() -> None:
     sys.stdout = DualLogger("bot_log.txt")
     sys.stderr = sys.stdout
 
-    print("=" * STARTUP_LOG_DIVIDER_WIDTH)
+    print(STARTUP_LOG_DIVIDER)
     print("Strategy Bot - Starting")
-    print("=" * STARTUP_LOG_DIVIDER_WIDTH)
+    print(STARTUP_LOG_DIVIDER)
+
+    # `kill -USR1 <pid>` cuts the current wait short
+    install_wakeup_signal()
 
     # Initialize recovery manager
     recovery_manager = RecoveryManager()
 
     with sync_playwright() as p:
-        # Browser configuration
-        browser = p.chromium.launch(
+        # Browser configuration (ignored when attaching to PLAYWRIGHT_CDP)
+        browser = launch_browser(
+            p,
             headless=False,
-            args=[
-                '--disable-blink-features=AutomationControlled',
-            ]
+            args=list(CHROMIUM_LAUNCH_ARGS),
         )
 
         # Create context with persistent state
@@ -258,8 +285,12 @@ def main() -> None:
         try:
             # Navigate to target
             print(f"[Init] Navigating to {TARGET_URL}")
+            # Wait for `load` (not just domcontentloaded) so client-side redirects to a
+            # login page have a chance to run before is_login_required() looks.
             page.goto(TARGET_URL, timeout=DEFAULT_TIMEOUT)
-            time.sleep(POST_NAVIGATION_SLEEP_SECONDS)
+            # For SPAs that redirect later, also wait for an element that only
+            # appears once the app has decided, e.g.:
+            # page.locator("#app-root, input[type='password']").first.wait_for(timeout=5000)
 
             # Check if login required
             if is_login_required(page):
@@ -267,22 +298,35 @@ def main() -> None:
                     print("[Error] Login timeout")
                     return
 
+            # Page is replaced every MAX_USES_PER_PAGE cycles to bound memory growth
+            page_pool = PagePool(context, TARGET_URL, first_page=page)
+
+            unhealthy_backoff = NETWORK_UNHEALTHY_RETRY_SLEEP_SECONDS
+
             # Main loop
             while True:
                 try:
                     # Check network health periodically
                     if not ensure_network_health():
-                        print("[Warning] Network unhealthy, waiting...")
-                        time.sleep(NETWORK_UNHEALTHY_RETRY_SLEEP_SECONDS)
+                        print(f"[Warning] Network unhealthy, retrying in {unhealthy_backoff}s...")
+                        interruptible_sleep(unhealthy_backoff)
+                        unhealthy_backoff = min(unhealthy_backoff * 2, NETWORK_UNHEALTHY_RETRY_MAX_SLEEP_SECONDS)
                         continue
+                    unhealthy_backoff = NETWORK_UNHEALTHY_RETRY_SLEEP_SECONDS
+
+                    # Next cycle is due get_wait_time() after this one starts
+                    # (monotonic, so wall-clock/NTP jumps don't stretch it)
+                    next_cycle_deadline = time.monotonic() + get_wait_time()
 
                     # Run strategy
+                    page = page_pool.acquire()
                     run_strategy(page, recovery_manager)
 
-                    # Wait before next iteration
-                    wait_seconds = get_wait_time()
+                    # Wait out the rest of the cycle
+                    wait_seconds = max(0.0, next_cycle_deadline - time.monotonic())
                     print(f"\n[Sleep] Waiting {wait_seconds/SECONDS_PER_MINUTE:.1f} minutes...")
-                    time.sleep(wait_seconds)
+                    if interruptible_sleep_until(next_cycle_deadline, watch_remote_control=True):
+                        print("[Sleep] Woken early")
 
                 except KeyboardInterrupt:
                     print("\n[Exit] User interrupted")
@@ -290,7 +334,7 @@ def main() -> None:
                 except Exception as e:
                     print(f"\n[Error] {e}")
                     recovery_manager.attempt_recovery(page, str(e))
-                    time.sleep(UNHANDLED_ERROR_RETRY_SLEEP_SECONDS)
+                    interruptible_sleep(UNHANDLED_ERROR_RETRY_SLEEP_SECONDS)
 
         finally:
             browser.close()